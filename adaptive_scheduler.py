@@ -0,0 +1,137 @@
+#///// adaptive_scheduler.py: samples each (size, complexity, distance_case) cell with fresh seeded
+# mazes until the confidence intervals on time and visited nodes are tight enough or the budget runs out.
+
+import math
+import random
+import statistics
+import time
+from maze import Maze
+from pathfinding import bfs, dfs, a_star
+
+ALGORITHMS = [("BFS", bfs), ("DFS", dfs), ("A*", a_star)]
+METRICS = ["Time_Seconds", "Visited_Nodes"]
+
+#///////////// two-sided 95% Student t critical values by degrees of freedom
+T_95 = {1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365, 8: 2.306,
+        9: 2.262, 10: 2.228, 12: 2.179, 15: 2.131, 20: 2.086, 25: 2.060, 30: 2.042}
+
+
+def t_critical(df):
+    if df > 30:
+        return 1.96
+    return T_95[max(k for k in T_95 if k <= df)]
+
+
+def confidence_interval(values):
+    """Returns (mean, 95% half-width); the half-width is infinite below two samples"""
+    mean = statistics.fmean(values)
+    if len(values) < 2:
+        return mean, float('inf')
+    return mean, t_critical(len(values) - 1) * statistics.stdev(values) / math.sqrt(len(values))
+
+
+def end_for(size, distance_case):
+    if distance_case == "short":
+        return (2, 2)
+    if distance_case == "medium":
+        return (size // 2, size // 2)
+    return (size - 1, size - 1)
+
+
+def run_trial(size, complexity, distance_case, seed):
+    """One seeded maze, same start/end placement as experiment.py.
+    Returns rows in the experiment_results.csv layout."""
+    random.seed(seed)
+    grid, _, _ = Maze(size, size, complexity=complexity).generate()
+    start, end = (1, 1), end_for(size, distance_case)
+    grid[start[0]][start[1]] = 2
+    grid[end[0]][end[1]] = 3
+
+    rows = []
+    for name, algorithm in ALGORITHMS:
+        start_t = time.perf_counter()
+        path, visited = algorithm(grid, start, end)
+        elapsed = time.perf_counter() - start_t
+        rows.append([name, size, complexity, distance_case, len(path), visited, elapsed])
+    return rows
+
+
+class AdaptiveScheduler:
+
+    def __init__(self, cells, target=0.05, min_samples=3, max_samples=50, budget=1000, seed=0):
+        #///////////// target: CI half-width relative to the mean, for every algorithm and metric
+        self.cells = list(cells)
+        self.target = target
+        self.min_samples = min_samples
+        self.max_samples = max_samples
+        self.budget = budget
+        self.seed = seed
+        self.samples = {cell: [] for cell in self.cells}
+        self.trials = 0
+
+    def relative_width(self, cell):
+        """Widest relative CI over algorithms and metrics, the cell's priority for more samples"""
+        worst = 0.0
+        rows = self.samples[cell]
+        for name, _ in ALGORITHMS:
+            for col in (5, 6):
+                values = [row[col] for row in rows if row[0] == name]
+                mean, half = confidence_interval(values)
+                if half == float('inf'):
+                    return float('inf')
+                if mean > 0:
+                    worst = max(worst, half / mean)
+        return worst
+
+    def _sample(self, cell):
+        seed = self.seed * 1_000_003 + self.trials
+        self.samples[cell].extend(run_trial(*cell, seed=seed))
+        self.trials += 1
+
+    def run(self, verbose=True):
+        for cell in self.cells:
+            for _ in range(self.min_samples):
+                if self.trials >= self.budget:
+                    break
+                self._sample(cell)
+
+        while self.trials < self.budget:
+            open_cells = [cell for cell in self.cells
+                          if len(self.samples[cell]) // len(ALGORITHMS) < self.max_samples
+                          and self.relative_width(cell) > self.target]
+            if not open_cells:
+                break
+            #//////////// next sample goes to the cell whose interval is widest
+            cell = max(open_cells, key=self.relative_width)
+            self._sample(cell)
+
+        if verbose:
+            for stat in self.cell_stats():
+                print(f"{stat['Algorithm']:<4} {stat['Maze_Size']}x{stat['Maze_Size']} c={stat['Complexity']} "
+                      f"{stat['Distance_Case']:<6} n={stat['Samples']:<3} "
+                      f"time {stat['Time_Seconds_Mean']:.6f}±{stat['Time_Seconds_CI']:.6f} "
+                      f"visited {stat['Visited_Nodes_Mean']:.1f}±{stat['Visited_Nodes_CI']:.1f}")
+            print(f"[INFO] Adaptive sampling used {self.trials} of {self.budget} trials")
+
+        return self.results(), self.cell_stats()
+
+    def results(self):
+        return [row for cell in self.cells for row in self.samples[cell]]
+
+    def cell_stats(self):
+        """Per (algorithm, cell) sample count, means and 95% CI half-widths"""
+        stats = []
+        for cell in self.cells:
+            converged = self.relative_width(cell) <= self.target
+            for name, _ in ALGORITHMS:
+                rows = [row for row in self.samples[cell] if row[0] == name]
+                if not rows:
+                    continue
+                stat = {"Algorithm": name, "Maze_Size": cell[0], "Complexity": cell[1],
+                        "Distance_Case": cell[2], "Samples": len(rows), "Converged": converged}
+                for col, metric in zip((6, 5), METRICS):
+                    mean, half = confidence_interval([row[col] for row in rows])
+                    stat[f"{metric}_Mean"] = mean
+                    stat[f"{metric}_CI"] = half
+                stats.append(stat)
+        return stats
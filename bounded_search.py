@@ -0,0 +1,258 @@
+#///// bounded_search.py: memory-bounded alternatives to bfs/a_star for very large mazes.
+# Both keep the (path, visited) contract; pass a dict as `stats` to get the peak memory estimate.
+
+import heapq
+import sys
+from itertools import count
+
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]  #/////////// up, down, left, right
+
+#///////////// rough cost of one stored search entry (heap tuple / dict slot holding a cell tuple)
+ENTRY_BYTES = sys.getsizeof((0, 0, (0, 0))) + sys.getsizeof((0, 0))
+
+
+def _manhattan(a, b):
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+def _neighbors(maze, cell):
+    r, c = cell
+    for dr, dc in DIRECTIONS:
+        nr, nc = r + dr, c + dc
+        if 0 <= nr < len(maze) and 0 <= nc < len(maze[0]) and maze[nr][nc] != 0:
+            yield (nr, nc)
+
+
+def ida_star(maze, start, end, tt_size=100_000, stats=None):
+    """Iterative-deepening A*. Memory is the current path plus a transposition table
+    of at most tt_size cells (best g seen this iteration). visited counts expansions
+    over all iterations, since cells are re-expanded on every deeper pass."""
+    bound = _manhattan(start, end)
+    expansions = 0
+    peak_entries = 1
+    path = [start]
+
+    while path[-1] != end:
+        table = {start: 0}
+        path = [start]
+        on_path = {start}
+        stack = [_neighbors(maze, start)]
+        next_bound = float('inf')
+
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                on_path.discard(path.pop())
+                continue
+
+            g = len(path)
+            f = g + _manhattan(child, end)
+            if f > bound:
+                next_bound = min(next_bound, f)
+                continue
+            if child in on_path or table.get(child, g + 1) <= g:
+                continue
+            #////////// once the table is full only existing entries are updated
+            if child in table or len(table) < tt_size:
+                table[child] = g
+
+            path.append(child)
+            on_path.add(child)
+            expansions += 1
+            peak_entries = max(peak_entries, len(table) + 2 * len(path))
+            if child == end:
+                break
+            stack.append(_neighbors(maze, child))
+
+        if not path:
+            if next_bound == float('inf'):
+                break
+            bound = next_bound
+            path = [start]
+
+    if stats is not None:
+        stats['peak_entries'] = peak_entries
+        stats['peak_bytes'] = peak_entries * ENTRY_BYTES
+    return path, expansions
+
+
+class _Node:
+    __slots__ = ('cell', 'g', 'f', 'parent', 'children', 'forgotten', 'expanded', 'version')
+
+    def __init__(self, cell, g, f, parent):
+        self.cell = cell
+        self.g = g
+        self.f = f
+        self.parent = parent
+        self.children = {}
+        #//////////// children pruned from memory -> their backed-up f
+        self.forgotten = {}
+        self.expanded = False
+        #//////////// bumped on every change, so stale heap entries can be skipped
+        self.version = 0
+
+
+#///////////// rough cost of one node held by memory_capped_a_star: the node, its cell,
+# its children and forgotten dicts and one entry in each of the two heaps
+NODE_BYTES = (sys.getsizeof(_Node((0, 0), 0, 0, None)) + sys.getsizeof((0, 0)) + 2 * sys.getsizeof({})
+              + 2 * sys.getsizeof((0, 0, 0, 0, None)))
+
+
+def memory_capped_a_star(maze, start, end, budget_bytes=1 << 20, stats=None):
+    """SMA*: A* that never holds more than budget_bytes worth of nodes (see NODE_BYTES).
+    When memory is full the worst leaf is forgotten and its f is backed up into its
+    parent, which regenerates it later if that f becomes the best again, so tighter
+    budgets cost more re-expansions; visited counts them all. The path is optimal.
+    When it has more cells than the budget can hold, the path is empty and
+    stats['exhausted'] is set. Like ida_star, proving an end unreachable is expensive."""
+    capacity = max(budget_bytes // NODE_BYTES, 2)
+    inf = float('inf')
+    root = _Node(start, 0, _manhattan(start, end), None)
+    memory = {start: root}
+    #///////////// open: best (f, deepest) node to expand; leaves: worst (f, shallowest) leaf to forget
+    open_heap = []
+    leaf_heap = []
+    order = count()
+    expansions = 0
+    peak_entries = 1
+    exhausted = False
+
+    def in_memory(node, version):
+        return memory.get(node.cell) is node and node.version == version
+
+    def refresh(node):
+        node.version += 1
+        if not node.expanded:
+            heapq.heappush(open_heap, (node.f, -node.g, next(order), node.version, node))
+        elif node.forgotten:
+            heapq.heappush(open_heap, (min(node.forgotten.values()), -node.g, next(order), node.version, node))
+        if not node.children and node.parent is not None:
+            heapq.heappush(leaf_heap, (-node.f, node.g, next(order), node.version, node))
+
+    def backup(node):
+        """Propagates min child f up the tree, dropping expanded nodes left with nothing below them"""
+        while node is not None:
+            if node.expanded and not node.children and not node.forgotten and node.parent is not None:
+                del memory[node.cell]
+                del node.parent.children[node.cell]
+                node.version += 1
+                node = node.parent
+                continue
+            new_f = node.f
+            if node.expanded:
+                new_f = min([child.f for child in node.children.values()] + list(node.forgotten.values()),
+                            default=inf)
+            changed = new_f != node.f
+            node.f = new_f
+            refresh(node)
+            if not changed:
+                return
+            node = node.parent
+
+    def forget(keep):
+        kept = None
+        while leaf_heap:
+            entry = heapq.heappop(leaf_heap)
+            node = entry[-1]
+            if not in_memory(node, entry[-2]) or node.children or node.parent is None:
+                continue
+            if node is keep:
+                kept = entry
+                continue
+            if kept:
+                heapq.heappush(leaf_heap, kept)
+            del memory[node.cell]
+            node.version += 1
+            parent = node.parent
+            del parent.children[node.cell]
+            if node.f < inf:
+                parent.forgotten[node.cell] = node.f
+            refresh(parent)
+            return True
+        if kept:
+            heapq.heappush(leaf_heap, kept)
+        return False
+
+    def discard(node):
+        """Drops a subtree reached by a worse route; the cell is regenerated from the better one"""
+        parent = node.parent
+        del parent.children[node.cell]
+        stack = [node]
+        while stack:
+            sub = stack.pop()
+            del memory[sub.cell]
+            sub.version += 1
+            stack.extend(sub.children.values())
+        backup(parent)
+
+    refresh(root)
+    while open_heap:
+        entry = heapq.heappop(open_heap)
+        node = entry[-1]
+        if not in_memory(node, entry[-2]):
+            continue
+
+        if node.cell == end:
+            path = []
+            while node is not None:
+                path.append(node.cell)
+                node = node.parent
+            path.reverse()
+            break
+        #//////////// the best key bounds the optimal cost from below, so from here no solution fits
+        if entry[0] + 1 > capacity:
+            exhausted = True
+            path = []
+            break
+        expansions += 1
+
+        g = node.g + 1
+        #//////////// first expansion generates every successor (pathmax: never below the parent's f),
+        # later ones only regenerate forgotten children at their backed-up f
+        if node.expanded:
+            successors = list(node.forgotten.items())
+        else:
+            successors = [(cell, node.f) for cell in _neighbors(maze, node.cell)]
+        node.expanded = True
+        candidates = []
+        for cell, bound in successors:
+            other = memory.get(cell)
+            if other is not None:
+                if other.g <= g:
+                    continue
+                discard(other)
+            candidates.append((max(g + _manhattan(cell, end), bound), cell))
+
+        while len(memory) + len(candidates) > capacity and forget(node):
+            pass
+        #//////////// successors stay recorded until now, so nothing above can mistake node for a dead end
+        for cell, _ in successors:
+            node.forgotten.pop(cell, None)
+        candidates.sort()
+        room = max(capacity - len(memory), 0)
+        for f, cell in candidates[:room]:
+            child = _Node(cell, g, f, node)
+            node.children[cell] = child
+            memory[cell] = child
+            refresh(child)
+        for f, cell in candidates[room:]:
+            node.forgotten[cell] = f
+        backup(node)
+        peak_entries = max(peak_entries, len(memory))
+
+        #//////////// drop stale heap entries so the heaps stay proportional to the nodes held
+        if len(open_heap) > 4 * capacity:
+            open_heap = [e for e in open_heap if in_memory(e[-1], e[-2])]
+            heapq.heapify(open_heap)
+        if len(leaf_heap) > 4 * capacity:
+            leaf_heap = [e for e in leaf_heap if in_memory(e[-1], e[-2])]
+            heapq.heapify(leaf_heap)
+    else:
+        path = []
+
+    if stats is not None:
+        stats['peak_entries'] = peak_entries
+        stats['peak_bytes'] = peak_entries * NODE_BYTES
+        stats['exhausted'] = exhausted
+    return path, expansions
@@ -0,0 +1,184 @@
+#///// corridor.py: contracts one-cell-wide corridors of a maze grid into weighted edges
+# so searches only touch junctions, dead-ends, start and end.
+
+import heapq
+
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]  #/////////// up, down, left, right
+
+
+def _open_neighbors(maze, r, c):
+    rows, cols = len(maze), len(maze[0])
+    neighbors = []
+    for dr, dc in DIRECTIONS:
+        nr, nc = r + dr, c + dc
+        if 0 <= nr < rows and 0 <= nc < cols and maze[nr][nc] != 0:
+            neighbors.append((nr, nc))
+    return neighbors
+
+
+class CorridorGraph:
+    """Reduced maze graph: nodes are junctions/dead-ends/endpoints, edges are corridors"""
+
+    def __init__(self, maze, keep=()):
+        self.cell_count = 0
+        #////////////// node -> {neighbor: (length, corridor cells in walking order)}
+        self.edges = {}
+        #////////////// corridor cell -> (node at one end, node at the other, corridor cells, index)
+        self.corridor_of = {}
+
+        degree = {}
+        for r in range(len(maze)):
+            for c in range(len(maze[0])):
+                if maze[r][c] != 0:
+                    self.cell_count += 1
+                    degree[(r, c)] = len(_open_neighbors(maze, r, c))
+
+        keep = set(keep)
+        for cell, d in degree.items():
+            if d != 2 or cell in keep:
+                self.edges[cell] = {}
+
+        for node in list(self.edges):
+            self._link(maze, node)
+        #////////////// a loop of corridor cells with no junction on it gets one cell promoted to a node
+        for cell in degree:
+            if cell not in self.edges and cell not in self.corridor_of:
+                self.edges[cell] = {}
+                self._link(maze, cell)
+
+    def _link(self, maze, node):
+        for nxt in _open_neighbors(maze, *node):
+            prev, cur = node, nxt
+            cells = []
+            #//////////// walk the corridor until it reaches another node
+            while cur not in self.edges:
+                cells.append(cur)
+                a, b = _open_neighbors(maze, *cur)
+                prev, cur = cur, (b if a == prev else a)
+            if cells and cells[0] not in self.corridor_of:
+                for i, cell in enumerate(cells):
+                    self.corridor_of[cell] = (node, cur, cells, i)
+            if cur == node:
+                continue
+            length = len(cells) + 1
+            known = self.edges[node].get(cur)
+            if known is None or length < known[0]:
+                self.edges[node][cur] = (length, cells)
+
+    @property
+    def node_count(self):
+        return len(self.edges)
+
+    @property
+    def edge_count(self):
+        return sum(len(adj) for adj in self.edges.values()) // 2
+
+    def reduction(self):
+        """Ratio of walkable cells to graph nodes"""
+        return self.cell_count / max(self.node_count, 1)
+
+    def _adjacent(self, node, extra):
+        if node not in extra:
+            return self.edges.get(node, {})
+        return {**self.edges.get(node, {}), **extra[node]}
+
+    def splice(self, *cells, maze=None):
+        """Temporary edges that attach cells outside the node set (e.g. a query's start/end)
+        to the graph, without modifying it. A corridor cell is joined to the nodes at both
+        ends of its corridor. Given the maze, an open cell the graph does not know (such as
+        a wall opened by an end marker) is joined through its open neighbours; that is exact
+        for endpoints, since a shortest path never passes back through them. Other cells
+        get no edges."""
+        extra = {}
+
+        def add(a, b, length, between):
+            known = extra.setdefault(a, {}).get(b)
+            if known is None or length < known[0]:
+                extra[a][b] = (length, between)
+
+        spliced = []
+
+        def attach(cell):
+            if cell in self.edges or cell in spliced:
+                return
+            spliced.append(cell)
+            u, v, corridor, i = self.corridor_of[cell]
+            add(cell, u, i + 1, corridor[:i][::-1])
+            add(u, cell, i + 1, corridor[:i])
+            add(cell, v, len(corridor) - i, corridor[i + 1:])
+            add(v, cell, len(corridor) - i, corridor[i + 1:][::-1])
+
+        for cell in dict.fromkeys(cells):
+            if cell in self.edges or cell in self.corridor_of:
+                attach(cell)
+            elif maze is not None and maze[cell[0]][cell[1]] != 0:
+                for near in _open_neighbors(maze, *cell):
+                    if near in self.edges or near in self.corridor_of:
+                        attach(near)
+                    elif near not in cells:
+                        continue
+                    add(cell, near, 1, [])
+                    add(near, cell, 1, [])
+
+        #//////////// two spliced cells on the same corridor can also reach each other directly
+        for a in spliced:
+            for b in spliced:
+                _, _, corridor_a, i = self.corridor_of[a]
+                _, _, corridor_b, j = self.corridor_of[b]
+                if corridor_a is corridor_b and i < j:
+                    add(a, b, j - i, corridor_a[i + 1:j])
+                    add(b, a, j - i, corridor_a[i + 1:j][::-1])
+        return extra
+
+    def expand(self, nodes, extra=None):
+        """Turn a node sequence back into the full cell-by-cell path"""
+        if not nodes:
+            return []
+        extra = extra or {}
+        path = [nodes[0]]
+        for u, v in zip(nodes, nodes[1:]):
+            path.extend(self._adjacent(u, extra)[v][1])
+            path.append(v)
+        return path
+
+    def shortest_path(self, start, end, extra=None):
+        """Dijkstra over corridor lengths; returns (node sequence, settled node count)"""
+        open_set = [(0, start)]
+        dist = {start: 0}
+        parent = {start: None}
+        settled = set()
+
+        while open_set:
+            d, current = heapq.heappop(open_set)
+            if current in settled:
+                continue
+            settled.add(current)
+
+            if current == end:
+                nodes = []
+                while current is not None:
+                    nodes.append(current)
+                    current = parent[current]
+                return nodes[::-1], len(settled)
+
+            for nxt, (length, _) in self._adjacent(current, extra or {}).items():
+                nd = d + length
+                if nxt not in dist or nd < dist[nxt]:
+                    dist[nxt] = nd
+                    parent[nxt] = current
+                    heapq.heappush(open_set, (nd, nxt))
+
+        return [], len(settled)
+
+
+def corridor_search(maze, start, end, graph=None):
+    """Shortest path through the contracted graph, same (path, visited) contract as bfs.
+    A reused graph works for any query: endpoints off the node set are spliced in
+    as temporary nodes (see CorridorGraph.splice)."""
+    if graph is None:
+        graph = CorridorGraph(maze, keep=(start, end))
+    extra = graph.splice(start, end, maze=maze)
+    if any(cell not in graph.edges and cell not in extra for cell in (start, end)):
+        return [], 0
+    nodes, visited = graph.shortest_path(start, end, extra)
+    return graph.expand(nodes, extra), visited
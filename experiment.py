@@ -1,8 +1,13 @@
 import csv
 import time
 from maze import Maze
-from pathfinding import bfs, dfs, a_star
-from plot_results import plot_results, filter_by_condition
+from pathfinding import bfs, dfs, a_star, with_dead_end_filling, ara_star, bitset_bfs
+from landmarks import LandmarkTable
+from corridor import CorridorGraph, corridor_search
+from bounded_search import ida_star, memory_capped_a_star, NODE_BYTES
+from adaptive_scheduler import AdaptiveScheduler
+from plot_results import plot_results, filter_by_condition, plot_anytime_quality
+from perf_history import record_run, git_commit
 import matplotlib.pyplot as plt
 
 results = []
@@ -12,43 +17,144 @@ complexities = [0.1, 0.3, 0.5, 0.7]
 distance_cases = ["short", "medium", "long"]
 
 #///////////////////// Running Experiments
-for size in sizes:
-    for complexity in complexities:
-        for distance_case in distance_cases:
+cell_stats = None
+adaptive = input("Sample each case adaptively until confidence targets are met? (y/n): ").strip().lower() == 'y'
+
+if adaptive:
+    #///////////////// Seeded mazes per case until the 95% CI is within 10% of the mean (or the budget runs out)
+    scheduler = AdaptiveScheduler(
+        [(size, complexity, distance_case) for size in sizes for complexity in complexities for distance_case in distance_cases],
+        target=0.10, min_samples=3, max_samples=50, budget=1500
+    )
+    results, cell_stats = scheduler.run()
+else:
+    for size in sizes:
+        for complexity in complexities:
+            #///////////////// One maze per size and complexity, shared by the three distance cases
             maze_obj = Maze(size, size, complexity=complexity)
-            grid, _, _ = maze_obj.generate()
-
-            start = (1, 1)
-            end = (size - 1, size - 1)
-
-            if distance_case == "short":
-                end = (2, 2)
-            elif distance_case == "medium":
-                end = (size // 2, size // 2)
-            elif distance_case == "long":
-                end = (size - 1, size - 1)
-
-            grid[start[0]][start[1]] = 2
-            grid[end[0]][end[1]] = 3
-
-            print(f"\nTesting Size: {size}x{size}, Complexity: {complexity}, Start: {start}, End: {end}")
+            base_grid, _, _ = maze_obj.generate()
 
+            #///////////////// ALT landmark table, built (or loaded) once per maze on the unmarked grid
             start_t = time.perf_counter()
-            path_bfs, visited_bfs = bfs(grid, start, end)
-            elapsed_bfs = time.perf_counter() - start_t
+            table = LandmarkTable.for_maze(base_grid, k=4)
+            table_time = time.perf_counter() - start_t
 
+            #///////////////// Corridor-contracted graph, also built once per maze; queries splice their endpoints in
             start_t = time.perf_counter()
-            path_dfs, visited_dfs = dfs(grid, start, end)
-            elapsed_dfs = time.perf_counter() - start_t
+            graph = CorridorGraph(base_grid)
+            graph_time = time.perf_counter() - start_t
 
-            start_t = time.perf_counter()
-            path_astar, visited_astar = a_star(grid, start, end)
-            elapsed_astar = time.perf_counter() - start_t
+            for distance_case in distance_cases:
+                grid = [row[:] for row in base_grid]
 
-            results.append(["BFS", size, complexity, distance_case, len(path_bfs), visited_bfs, elapsed_bfs])
-            results.append(["DFS", size, complexity, distance_case, len(path_dfs), visited_dfs, elapsed_dfs])
-            results.append(["A*", size, complexity, distance_case, len(path_astar), visited_astar, elapsed_astar])
+                start = (1, 1)
+                end = (size - 1, size - 1)
 
+                if distance_case == "short":
+                    end = (2, 2)
+                elif distance_case == "medium":
+                    end = (size // 2, size // 2)
+                elif distance_case == "long":
+                    end = (size - 1, size - 1)
+
+                grid[start[0]][start[1]] = 2
+                grid[end[0]][end[1]] = 3
+
+                print(f"\nTesting Size: {size}x{size}, Complexity: {complexity}, Start: {start}, End: {end}")
+
+                start_t = time.perf_counter()
+                path_bfs, visited_bfs = bfs(grid, start, end)
+                elapsed_bfs = time.perf_counter() - start_t
+
+                start_t = time.perf_counter()
+                path_dfs, visited_dfs = dfs(grid, start, end)
+                elapsed_dfs = time.perf_counter() - start_t
+
+                start_t = time.perf_counter()
+                path_astar, visited_astar = a_star(grid, start, end)
+                elapsed_astar = time.perf_counter() - start_t
+
+                results.append(["BFS", size, complexity, distance_case, len(path_bfs), visited_bfs, elapsed_bfs])
+                results.append(["DFS", size, complexity, distance_case, len(path_dfs), visited_dfs, elapsed_dfs])
+                results.append(["A*", size, complexity, distance_case, len(path_astar), visited_astar, elapsed_astar])
+
+                #///////////// Bit-parallel BFS (hop count only); time includes building the walkable mask
+                start_t = time.perf_counter()
+                hops, visited_bits = bitset_bfs(grid, start, end)
+                elapsed_bits = time.perf_counter() - start_t
+                print(f"  Bitset BFS: {hops} hops, {elapsed_bits:.6f}s vs BFS {elapsed_bfs:.6f}s "
+                      f"({elapsed_bfs / elapsed_bits:.1f}x)")
+                results.append(["BFS-bitset", size, complexity, distance_case, hops + 1 if hops >= 0 else 0, visited_bits, elapsed_bits])
+
+                #///////////// Search over the corridor-contracted graph (built outside the timing)
+                start_t = time.perf_counter()
+                path_cor, visited_cor = corridor_search(grid, start, end, graph=graph)
+                elapsed_cor = time.perf_counter() - start_t
+                print(f"  Corridor graph: {graph.node_count} nodes for {graph.cell_count} cells "
+                      f"({graph.reduction():.1f}x fewer), built in {graph_time:.6f}s; "
+                      f"settled {visited_cor} vs BFS visited {visited_bfs}")
+                results.append(["Corridor", size, complexity, distance_case, len(path_cor), visited_cor, elapsed_cor])
+
+                #///////////// A* with ALT landmarks, reusing the maze's table (built outside the timing)
+                start_t = time.perf_counter()
+                path_alt, visited_alt = a_star(grid, start, end, landmarks=table)
+                elapsed_alt = time.perf_counter() - start_t
+                drop = 100 * (1 - visited_alt / visited_astar) if visited_astar else 0
+                print(f"  A* ALT: visited {visited_alt} vs {visited_astar} with Manhattan "
+                      f"({drop:.1f}% fewer expansions), table {table_time:.6f}s")
+                results.append(["A*+ALT", size, complexity, distance_case, len(path_alt), visited_alt, elapsed_alt])
+
+                #///////////// Memory-bounded modes, with their peak memory estimate. Both re-expand the
+                # component over and over when the end is cut off, so they only run on reachable ends.
+                if path_bfs:
+                    #///////////// SMA* may hold nodes for a quarter of the cells
+                    sma_stats = {}
+                    sma_budget = NODE_BYTES * size * size // 4
+                    start_t = time.perf_counter()
+                    path_sma, visited_sma = memory_capped_a_star(grid, start, end, budget_bytes=sma_budget, stats=sma_stats)
+                    elapsed_sma = time.perf_counter() - start_t
+                    results.append(["SMA*", size, complexity, distance_case, len(path_sma), visited_sma, elapsed_sma])
+                    verdict = "path does not fit" if sma_stats['exhausted'] else f"peak ~{sma_stats['peak_bytes']} bytes"
+                    print(f"  SMA* ({sma_budget // 1024} KB budget): visited {visited_sma}, {verdict}")
+
+                    ida_stats = {}
+                    start_t = time.perf_counter()
+                    path_ida, visited_ida = ida_star(grid, start, end, stats=ida_stats)
+                    elapsed_ida = time.perf_counter() - start_t
+                    results.append(["IDA*", size, complexity, distance_case, len(path_ida), visited_ida, elapsed_ida])
+                    print(f"  IDA*: expansions {visited_ida}, peak ~{ida_stats['peak_bytes']} bytes")
+                else:
+                    print("  SMA*, IDA*: skipped, end is unreachable")
+
+                #///////////// Same solvers after dead-end filling; time includes the filling pass
+                for name, algorithm, elapsed_plain in [("BFS", bfs, elapsed_bfs), ("DFS", dfs, elapsed_dfs), ("A*", a_star, elapsed_astar)]:
+                    start_t = time.perf_counter()
+                    path_df, visited_df, pruned, fill_time = with_dead_end_filling(algorithm, grid, start, end)
+                    elapsed_df = time.perf_counter() - start_t
+                    verdict = "pays off" if elapsed_df < elapsed_plain else "does not pay off"
+                    print(f"  {name} + dead-end filling: pruned {pruned} cells in {fill_time:.6f}s, "
+                          f"total {elapsed_df:.6f}s vs {elapsed_plain:.6f}s ({verdict})")
+                    results.append([f"{name}+DEF", size, complexity, distance_case, len(path_df), visited_df, elapsed_df])
+
+
+#///////////////////// Anytime (ARA*) sweep: best path returned within each per-query time budget
+run_anytime = input("\nRun the ARA* time-budget sweep? (y/n): ")
+if run_anytime.lower() == 'y':
+    budgets_ms = [0.1, 0.25, 0.5, 1, 2, 5, 10, 25]
+    anytime_records = []
+    for size in sizes:
+        for complexity in complexities:
+            grid, start, end = Maze(size, size, complexity=complexity).generate()
+            optimal, _ = bfs(grid, start, end)
+            if not optimal:
+                continue
+            for budget in budgets_ms:
+                ara_stats = {}
+                path_ara, _ = ara_star(grid, start, end, budget_ms=budget, stats=ara_stats)
+                anytime_records.append([budget, size, complexity, len(path_ara), len(optimal), ara_stats['bound']])
+            print(f"  ARA* {size}x{size} c={complexity}: optimal {len(optimal)}, "
+                  f"at {budgets_ms[0]}ms -> {anytime_records[-len(budgets_ms)][3]}, at {budgets_ms[-1]}ms -> {len(path_ara)}")
+    plot_anytime_quality(anytime_records)
 
 save_csv = input("\nWould you like to save the experiment results to a CSV file? (y/n): ")
 if save_csv.lower() == 'y':
@@ -60,6 +166,12 @@ if save_csv.lower() == 'y':
 else:
     print("\n[INFO] Results were not saved to CSV.")
 
+save_history = input("Would you like to append this run to the benchmark history? (y/n): ")
+if save_history.lower() == 'y':
+    workload = "adaptive" if adaptive else "experiment"
+    run_id = record_run(results, workload=workload)
+    print(f"[OK] Run {run_id} recorded for commit {git_commit()[:12]} (compare with: python perf_history.py compare --workload {workload})")
+
 plt.show(block=False)
 
 
@@ -109,7 +221,7 @@ if data_source_choice == '1':
     handle_historical_data()
 
 elif data_source_choice == '2':
-    plot_results(dataset_source='live', current_data=results)
+    plot_results(dataset_source='live', current_data=results, cell_stats=cell_stats)
 
 else:
     print("[!] Invalid choice, defaulting to historical CSV.")
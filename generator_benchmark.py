@@ -0,0 +1,54 @@
+#///// generator_benchmark.py: throughput (cells/sec) and peak memory of the maze generators.
+# Eller is measured twice: building a full Maze grid, and streaming rows without keeping them.
+
+import random
+import sys
+import time
+import tracemalloc
+from maze import Maze, GENERATORS, eller_rows
+
+sizes = [51, 101, 201, 401]
+
+#//////////// the recursive backtracker goes roughly one frame deep per carved cell
+sys.setrecursionlimit(max(sys.getrecursionlimit(), max(sizes) ** 2))
+
+
+def measure(build, seed=0):
+    """Times an untraced build, then repeats it under tracemalloc only for the peak,
+    since tracing overhead differs a lot between generators and would skew cells/s"""
+    random.seed(seed)
+    start_t = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - start_t
+
+    random.seed(seed)
+    tracemalloc.start()
+    build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def stream_eller(size):
+    open_cells = 0
+    for row in eller_rows(size, size):
+        open_cells += sum(row)
+    return open_cells
+
+
+def run_benchmark():
+    results = []
+    for size in sizes:
+        cases = [(name, lambda name=name: Maze(size, size, complexity=0.0, algorithm=name).generate())
+                 for name in GENERATORS]
+        cases.append(("eller (stream)", lambda: stream_eller(size)))
+
+        for name, build in cases:
+            elapsed, peak = measure(build, seed=size)
+            results.append([name, size, size * size / elapsed, peak])
+            print(f"{name:<15} {size}x{size}: {size * size / elapsed:>12,.0f} cells/s, peak {peak / 1024:,.1f} KiB")
+    return results
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,129 @@
+#///// landmarks.py: ALT (A*, Landmarks, Triangle inequality) heuristic tables for a_star.
+# Exact BFS distances from K landmarks are stored as int32 arrays and cached on disk per maze (LRU-bounded).
+
+import hashlib
+import os
+import random
+from collections import deque
+import numpy as np
+
+UNREACHABLE = -1
+
+
+def bfs_distances(maze, source):
+    """Exact hop distance from source to every open cell, UNREACHABLE elsewhere"""
+    rows, cols = len(maze), len(maze[0])
+    dist = np.full((rows, cols), UNREACHABLE, dtype=np.int32)
+    dist[source] = 0
+    queue = deque([source])
+
+    while queue:
+        r, c = queue.popleft()
+        d = dist[r, c] + 1
+        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+            nr, nc = r + dr, c + dc
+            if (0 <= nr < rows and 0 <= nc < cols
+                    and maze[nr][nc] != 0 and dist[nr, nc] == UNREACHABLE):
+                dist[nr, nc] = d
+                queue.append((nr, nc))
+
+    return dist
+
+
+def maze_key(maze):
+    """Stable fingerprint of the walkable layout (start/end markers ignored)"""
+    mask = np.packbits(np.array(maze) != 0)
+    return hashlib.sha1(mask.tobytes() + str((len(maze), len(maze[0]))).encode()).hexdigest()[:16]
+
+
+def _evict(cache_dir, max_files):
+    files = [os.path.join(cache_dir, name) for name in os.listdir(cache_dir) if name.endswith('.npz')]
+    if len(files) <= max_files:
+        return
+    files.sort(key=os.path.getmtime)
+    for path in files[:len(files) - max_files]:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class LandmarkTable:
+
+    def __init__(self, landmarks, distances):
+        self.landmarks = landmarks
+        #///////////// shape (K, rows, cols), int32
+        self.distances = distances
+
+    @classmethod
+    def build(cls, maze, k=4, seed=None):
+        """Farthest-point landmark selection: each new landmark is the open cell
+        farthest from all landmarks chosen so far"""
+        open_cells = [(r, c) for r in range(len(maze)) for c in range(len(maze[0])) if maze[r][c] != 0]
+        if not open_cells:
+            return cls([], np.zeros((0, len(maze), len(maze[0])), dtype=np.int32))
+
+        rng = random.Random(seed)
+        #//////////// start from the cell farthest from a random one so landmarks sit on the rim
+        seed_dist = bfs_distances(maze, rng.choice(open_cells))
+        landmarks = [tuple(int(i) for i in np.unravel_index(np.argmax(seed_dist), seed_dist.shape))]
+        distances = [bfs_distances(maze, landmarks[0])]
+
+        open_mask = np.array(maze) != 0
+        while len(landmarks) < k:
+            stacked = np.stack(distances)
+            #////////// cells no landmark reaches yet (other components) rank as infinitely far
+            nearest = np.where(stacked == UNREACHABLE, np.iinfo(np.int32).max, stacked).min(axis=0)
+            nearest = np.where(open_mask, nearest, UNREACHABLE)
+            candidate = tuple(int(i) for i in np.unravel_index(np.argmax(nearest), nearest.shape))
+            if nearest[candidate] <= 0:
+                break
+            landmarks.append(candidate)
+            distances.append(bfs_distances(maze, candidate))
+
+        return cls(landmarks, np.stack(distances))
+
+    def save(self, path):
+        np.savez_compressed(path, landmarks=np.array(self.landmarks, dtype=np.int32).reshape(-1, 2),
+                            distances=self.distances)
+
+    @classmethod
+    def load(cls, path):
+        data = np.load(path)
+        landmarks = [tuple(int(i) for i in cell) for cell in data['landmarks']]
+        return cls(landmarks, data['distances'].astype(np.int32))
+
+    @classmethod
+    def for_maze(cls, maze, k=4, cache_dir='landmarks', max_files=64):
+        """Loads the persisted table for this maze layout, building and saving it on first use.
+        The cache keeps the max_files most recently used tables and evicts the rest."""
+        os.makedirs(cache_dir, exist_ok=True)
+        path = os.path.join(cache_dir, f"{maze_key(maze)}_k{k}.npz")
+        if os.path.exists(path):
+            #//////////// touch on load so eviction drops the least recently used tables
+            os.utime(path)
+            return cls.load(path)
+        table = cls.build(maze, k=k)
+        table.save(path)
+        _evict(cache_dir, max_files)
+        return table
+
+    def heuristic(self, end):
+        """Returns h(cell) = max over landmarks of |d(L, end) - d(L, cell)|, computed
+        lazily per cell from the stored int32 arrays, so a query costs O(K) per expansion"""
+        target = self.distances[:, end[0], end[1]]
+        #//////////// landmarks that cannot see the end give no bound
+        usable = [(memoryview(np.ascontiguousarray(self.distances[k])), int(target[k]))
+                  for k in range(len(target)) if target[k] != UNREACHABLE]
+
+        def h(cell):
+            r, c = cell
+            best = 0
+            for dist, to_end in usable:
+                d = dist[r, c]
+                #//////////// nor do landmarks that cannot see the cell
+                if d != UNREACHABLE and abs(to_end - d) > best:
+                    best = abs(to_end - d)
+            return best
+
+        return h
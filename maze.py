@@ -2,11 +2,76 @@ import random
 import matplotlib.pyplot as plt
 import numpy as np
 
+GENERATORS = ('backtracker', 'kruskal', 'eller')
+
+
+def eller_rows(rows, cols, rng=random):
+    """Eller's algorithm: yields the maze one grid row at a time (0 = wall, 1 = path)
+    keeping only O(cols) state, so arbitrarily tall mazes can be streamed"""
+    n_rows, n_cols = (rows - 1) // 2, (cols - 1) // 2
+    yield [0] * cols
+    emitted = 1
+
+    #//////////// set id per cell column, and the member columns of every set
+    sets = [None] * n_cols
+    members = {}
+    next_id = 0
+
+    for i in range(n_rows):
+        last = i == n_rows - 1
+        for j in range(n_cols):
+            if sets[j] is None:
+                sets[j] = next_id
+                members[next_id] = [j]
+                next_id += 1
+
+        row = [0] * cols
+        for j in range(n_cols):
+            row[2 * j + 1] = 1
+        #//////////// join neighbours from different sets (always on the last row)
+        for j in range(n_cols - 1):
+            a, b = sets[j], sets[j + 1]
+            if a != b and (last or rng.random() < 0.5):
+                if len(members[a]) < len(members[b]):
+                    a, b = b, a
+                for k in members[b]:
+                    sets[k] = a
+                members[a].extend(members.pop(b))
+                row[2 * j + 2] = 1
+        yield row
+        emitted += 1
+        if last:
+            break
+
+        #//////////// every set carries at least one passage down to the next row
+        below = [0] * cols
+        next_sets = [None] * n_cols
+        next_members = {}
+        for set_id, cols_in_set in members.items():
+            rng.shuffle(cols_in_set)
+            down = cols_in_set[:1] + [j for j in cols_in_set[1:] if rng.random() < 0.3]
+            for j in down:
+                below[2 * j + 1] = 1
+                next_sets[j] = set_id
+            next_members[set_id] = down
+        sets, members = next_sets, next_members
+        yield below
+        emitted += 1
+
+    while emitted < rows:
+        yield [0] * cols
+        emitted += 1
+
+
 class Maze:
 
-    def __init__(self, rows, cols, complexity=0.3):
+    def __init__(self, rows, cols, complexity=0.3, algorithm='backtracker'):
+        if algorithm not in GENERATORS:
+            raise ValueError(f"Unknown maze algorithm '{algorithm}', choose from {GENERATORS}")
         self.rows = rows
         self.cols = cols
+        #/////////////Base maze generator: 'backtracker', 'kruskal' or 'eller'
+        self.algorithm = algorithm
         #/////////////Wall density (0.0 - 1.0)
         self.complexity = complexity 
         #///////////// Initializing grid: 0 = wall, 1 = path
@@ -16,7 +81,12 @@ class Maze:
 
     def generate(self):
         #////////////Creating a valid base maze
-        self._carve_path(1, 1)
+        if self.algorithm == 'kruskal':
+            self._kruskal()
+        elif self.algorithm == 'eller':
+            self.grid = list(eller_rows(self.rows, self.cols))
+        else:
+            self._carve_path(1, 1)
 
         #//////////Adding extra paths based on complexity
         extra_path_attempts = int(self.complexity * self.rows * self.cols)
@@ -51,6 +121,42 @@ class Maze:
                 #/////////recursively carve the path
                 self._carve_path(nr, nc)
 
+    def _kruskal(self):
+        #////////////Randomized Kruskal over the odd cells, array-based union-find
+        n_cols = (self.cols - 1) // 2
+        n_cells = ((self.rows - 1) // 2) * n_cols
+        parent = list(range(n_cells))
+        size = [1] * n_cells
+
+        def find(x):
+            while parent[x] != x:
+                #//////// path compression by halving
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            return x
+
+        walls = []
+        for i in range(n_cells):
+            if i % n_cols + 1 < n_cols:
+                walls.append((i, i + 1))
+            if i + n_cols < n_cells:
+                walls.append((i, i + n_cols))
+        random.shuffle(walls)
+
+        for i in range(n_cells):
+            self.grid[2 * (i // n_cols) + 1][2 * (i % n_cols) + 1] = 1
+        for a, b in walls:
+            ra, rb = find(a), find(b)
+            if ra == rb:
+                continue
+            if size[ra] < size[rb]:
+                ra, rb = rb, ra
+            parent[rb] = ra
+            size[ra] += size[rb]
+            r1, c1 = 2 * (a // n_cols) + 1, 2 * (a % n_cols) + 1
+            r2, c2 = 2 * (b // n_cols) + 1, 2 * (b % n_cols) + 1
+            self.grid[(r1 + r2) // 2][(c1 + c2) // 2] = 1
+
     def add_start_end_points(self):
         self.start = (random.randint(1, self.rows - 2), random.randint(1, self.cols - 2))
         self.grid[self.start[0]][self.start[1]] = 2 
@@ -1,5 +1,7 @@
 import heapq
+import time
 from collections import deque
+import numpy as np
 
 def is_walkable(x, y, grid):
     return grid[x][y] != 1
@@ -56,9 +58,16 @@ def bfs(maze, start, end):
     return [], len(visited)
 
 
-def a_star(maze, start, end):
-    def heuristic(a, b):
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+def a_star(maze, start, end, landmarks=None):
+    #///////////// landmarks: optional LandmarkTable, switches the heuristic from Manhattan to ALT
+    if landmarks is not None:
+        alt = landmarks.heuristic(end)
+
+        def heuristic(a, b):
+            return max(alt(a), abs(a[0] - b[0]) + abs(a[1] - b[1]))
+    else:
+        def heuristic(a, b):
+            return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
     open_set = []
     heapq.heappush(open_set, (heuristic(start, end), 0, start, [start]))
@@ -86,3 +95,238 @@ def a_star(maze, start, end):
                 ))
 
     return [], len(visited)
+
+
+#///////////// Dead-end filling: walls off open cells with a single open neighbor until nothing changes
+def fill_dead_ends(maze, start, end):
+    """Returns (pruned grid, number of cells pruned, seconds spent)"""
+    t0 = time.perf_counter()
+    grid = np.array(maze)
+    open_cells = grid != 0
+    protected = np.zeros_like(open_cells)
+    protected[start] = True
+    protected[end] = True
+
+    pruned = 0
+    while True:
+        padded = np.pad(open_cells, 1)
+        open_neighbors = (padded[:-2, 1:-1].astype(np.int8) + padded[2:, 1:-1]
+                          + padded[1:-1, :-2] + padded[1:-1, 2:])
+        dead = open_cells & (open_neighbors <= 1) & ~protected
+        count = int(dead.sum())
+        if count == 0:
+            break
+        open_cells &= ~dead
+        pruned += count
+
+    filled = np.where(open_cells, grid, 0).tolist()
+    return filled, pruned, time.perf_counter() - t0
+
+
+def with_dead_end_filling(algorithm, maze, start, end):
+    """Runs any (maze, start, end) solver on the dead-end filled grid.
+    Returns (path, visited, pruned, fill_seconds)"""
+    filled, pruned, fill_seconds = fill_dead_ends(maze, start, end)
+    path, visited = algorithm(filled, start, end)
+    return path, visited, pruned, fill_seconds
+
+
+#///////////// Multi-source / multi-target search: one traversal for "which of these N exits is closest"
+def _trace(parent, cell):
+    path = []
+    while cell is not None:
+        path.append(cell)
+        cell = parent[cell]
+    return path[::-1]
+
+
+def multi_bfs(maze, sources, targets, with_labels=False):
+    """BFS seeded with every source that stops at the first target reached.
+    path[0] is the winning source and path[-1] the winning target.
+    with_labels=True keeps going over the whole grid and also returns a
+    Voronoi-style grid holding the index into targets of the nearest target
+    (-1 if none). The grid is undirected, so that traversal is seeded from the
+    targets instead; path keeps the same source-to-target orientation."""
+    seeds, goals = (list(targets), set(sources)) if with_labels else (sources, set(targets))
+    parent = {}
+    labels = [[-1] * len(maze[0]) for _ in range(len(maze))] if with_labels else None
+    queue = deque()
+    for i, seed in enumerate(seeds):
+        if seed not in parent:
+            parent[seed] = None
+            queue.append(seed)
+            if with_labels:
+                labels[seed[0]][seed[1]] = i
+    path = []
+
+    while queue:
+        r, c = queue.popleft()
+
+        if (r, c) in goals and not path:
+            path = _trace(parent, (r, c))
+            if not with_labels:
+                break
+            path.reverse()
+
+        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+            nr, nc = r + dr, c + dc
+            if (0 <= nr < len(maze) and 0 <= nc < len(maze[0])
+                    and maze[nr][nc] != 0 and (nr, nc) not in parent):
+                parent[(nr, nc)] = (r, c)
+                if with_labels:
+                    labels[nr][nc] = labels[r][c]
+                queue.append((nr, nc))
+
+    if with_labels:
+        return path, len(parent), labels
+    return path, len(parent)
+
+
+def multi_a_star(maze, sources, targets):
+    """A* from many sources to many targets; h is the Manhattan distance to the
+    nearest target, which stays admissible. Same path convention as multi_bfs."""
+    targets = list(targets)
+    target_set = set(targets)
+
+    def heuristic(a):
+        return min(abs(a[0] - t[0]) + abs(a[1] - t[1]) for t in targets)
+
+    open_set = []
+    parent = {}
+    best_g = {}
+    for source in sources:
+        if source not in best_g:
+            best_g[source] = 0
+            parent[source] = None
+            heapq.heappush(open_set, (heuristic(source), 0, source))
+    visited = set()
+
+    while open_set:
+        f, g, current = heapq.heappop(open_set)
+
+        if current in visited:
+            continue
+        visited.add(current)
+
+        if current in target_set:
+            return _trace(parent, current), len(visited)
+
+        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+            nr, nc = current[0] + dr, current[1] + dc
+            if (0 <= nr < len(maze) and 0 <= nc < len(maze[0])
+                    and maze[nr][nc] != 0 and best_g.get((nr, nc), g + 2) > g + 1):
+                best_g[(nr, nc)] = g + 1
+                parent[(nr, nc)] = current
+                heapq.heappush(open_set, (g + 1 + heuristic((nr, nc)), g + 1, (nr, nc)))
+
+    return [], len(visited)
+
+
+#///////////// Anytime search (ARA*): a fast inflated-heuristic path first, then tighter ones while time allows
+def ara_star(maze, start, end, budget_ms=50.0, initial_weight=3.0, weight_step=0.5, stats=None):
+    """Returns (best path found within budget_ms, expansions). The suboptimality bound of
+    that path (path length <= bound * optimal) goes to stats['bound']; stats['history']
+    lists (elapsed_ms, path length, bound) for every improvement."""
+    deadline = time.perf_counter() + budget_ms / 1000
+    t0 = time.perf_counter()
+
+    def heuristic(a):
+        return abs(a[0] - end[0]) + abs(a[1] - end[1])
+
+    g = {start: 0}
+    parent = {start: None}
+    open_states = {start}
+    closed = set()
+    incons = set()
+    weight = initial_weight
+    open_set = [(weight * heuristic(start), 0, start)]
+    expansions = 0
+    best_path, bound, history = [], float('inf'), []
+
+    def improve_path():
+        nonlocal expansions
+        while open_set:
+            f, g_pushed, current = open_set[0]
+            if current not in open_states or g[current] != g_pushed:
+                heapq.heappop(open_set)
+                continue
+            if f >= g.get(end, float('inf')):
+                return True
+            if time.perf_counter() > deadline:
+                return False
+            heapq.heappop(open_set)
+            open_states.discard(current)
+            closed.add(current)
+            expansions += 1
+
+            for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+                nr, nc = current[0] + dr, current[1] + dc
+                nxt = (nr, nc)
+                if (0 <= nr < len(maze) and 0 <= nc < len(maze[0])
+                        and maze[nr][nc] != 0 and g.get(nxt, float('inf')) > g[current] + 1):
+                    g[nxt] = g[current] + 1
+                    parent[nxt] = current
+                    if nxt in closed:
+                        #////////// already expanded this round, revisit it in the next one
+                        incons.add(nxt)
+                    else:
+                        open_states.add(nxt)
+                        heapq.heappush(open_set, (g[nxt] + weight * heuristic(nxt), g[nxt], nxt))
+        return True
+
+    while True:
+        finished = improve_path()
+        if finished and end in g:
+            pending = open_states | incons
+            lower = min((g[s] + heuristic(s) for s in pending), default=g[end])
+            bound = min(weight, g[end] / lower) if lower > 0 else 1.0
+            best_path = _trace(parent, end)
+            if not history or history[-1][1:] != (len(best_path), bound):
+                history.append(((time.perf_counter() - t0) * 1000, len(best_path), bound))
+        if not finished or bound <= 1.0 or end not in g:
+            break
+
+        #////////// lower the weight, merge INCONS back into OPEN and re-key everything
+        weight = max(1.0, weight - weight_step)
+        open_states |= incons
+        incons.clear()
+        closed.clear()
+        open_set[:] = [(g[s] + weight * heuristic(s), g[s], s) for s in open_states]
+        heapq.heapify(open_set)
+
+    if stats is not None:
+        stats['bound'] = bound
+        stats['weight'] = weight
+        stats['history'] = history
+    return best_path, expansions
+
+
+#///////////// Bit-parallel BFS: the grid is one big int, rows packed with a zero guard bit so shifts never wrap
+def walkable_mask(maze):
+    """Returns (mask, stride); bit r * stride + c is set when maze[r][c] is walkable"""
+    stride = len(maze[0]) + 1
+    bits = ''.join('0' + ''.join('1' if v != 0 else '0' for v in reversed(row)) for row in reversed(maze))
+    return int(bits, 2), stride
+
+
+def bitset_bfs(maze, start, end, mask=None):
+    """Reachability / hop distance only, one shift-and-AND step per BFS layer.
+    Returns (hops from start to end or -1 if unreachable, cells reached);
+    a reachable end gives a bfs path of hops + 1 cells. Pass a walkable_mask(maze)
+    result as mask to reuse it across queries on the same grid."""
+    walk, stride = mask if mask is not None else walkable_mask(maze)
+    start_bit = 1 << (start[0] * stride + start[1])
+    end_bit = 1 << (end[0] * stride + end[1])
+    if not walk & start_bit or not walk & end_bit:
+        return -1, 0
+
+    visited = frontier = start_bit
+    hops = 0
+    while frontier:
+        if frontier & end_bit:
+            return hops, visited.bit_count()
+        frontier = ((frontier << 1) | (frontier >> 1) | (frontier << stride) | (frontier >> stride)) & walk & ~visited
+        visited |= frontier
+        hops += 1
+
+    return -1, visited.bit_count()
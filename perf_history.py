@@ -0,0 +1,226 @@
+#///// perf_history.py: append-only benchmark history in SQLite, keyed by git commit, machine and workload,
+# plus a compare command that flags statistically significant slowdowns per algorithm and maze size.
+#
+# Usage:
+#   python perf_history.py record experiment_results.csv [--workload experiment]
+#   python perf_history.py compare [--baseline COMMIT] [--candidate COMMIT] [--workload experiment]
+#   python perf_history.py trend [--workload experiment]
+
+import argparse
+import csv
+import hashlib
+import math
+import os
+import platform
+import sqlite3
+import statistics
+import subprocess
+from datetime import datetime
+
+DB_PATH = 'benchmark_history.db'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    recorded_at TEXT NOT NULL,
+    git_commit TEXT NOT NULL,
+    machine TEXT NOT NULL,
+    machine_info TEXT NOT NULL,
+    workload TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS samples (
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    algorithm TEXT NOT NULL,
+    maze_size INTEGER NOT NULL,
+    complexity REAL NOT NULL,
+    distance_case TEXT NOT NULL,
+    path_length INTEGER NOT NULL,
+    visited_nodes INTEGER NOT NULL,
+    time_seconds REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS samples_run ON samples(run_id);
+"""
+
+
+def git_commit():
+    """Current HEAD, suffixed with -dirty when the tree has local changes"""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True).stdout.strip()
+        dirty = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                               capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+    return commit + ('-dirty' if dirty else '')
+
+
+def machine_info():
+    return f"{platform.node()} | {platform.machine()} | {platform.processor() or 'cpu?'} x{os.cpu_count()} | " \
+           f"{platform.system()} {platform.release()} | Python {platform.python_version()}"
+
+
+def machine_fingerprint():
+    return hashlib.sha1(machine_info().encode()).hexdigest()[:12]
+
+
+def connect(db_path=DB_PATH):
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def record_run(results, workload='experiment', db_path=DB_PATH):
+    """Appends one run; results are rows in the experiment_results.csv layout"""
+    with connect(db_path) as conn:
+        cur = conn.execute(
+            "INSERT INTO runs (recorded_at, git_commit, machine, machine_info, workload) VALUES (?, ?, ?, ?, ?)",
+            (datetime.now().isoformat(timespec='seconds'), git_commit(), machine_fingerprint(), machine_info(), workload))
+        run_id = cur.lastrowid
+        conn.executemany(
+            "INSERT INTO samples VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(run_id, algo, int(size), float(complexity), case, int(path_len), int(visited), float(seconds))
+             for algo, size, complexity, case, path_len, visited, seconds in results])
+    return run_id
+
+
+def load_history(workload='experiment', machine=None, db_path=DB_PATH):
+    """All samples for a workload on one machine (this one by default), oldest run first"""
+    import pandas as pd
+    with connect(db_path) as conn:
+        return pd.read_sql_query(
+            "SELECT r.id AS Run, r.recorded_at AS Recorded_At, r.git_commit AS Commit_Id, s.algorithm AS Algorithm, "
+            "s.maze_size AS Maze_Size, s.complexity AS Complexity, s.distance_case AS Distance_Case, "
+            "s.path_length AS Path_Length, s.visited_nodes AS Visited_Nodes, s.time_seconds AS Time_Seconds "
+            "FROM samples s JOIN runs r ON r.id = s.run_id WHERE r.workload = ? AND r.machine = ? ORDER BY r.id",
+            conn, params=(workload, machine or machine_fingerprint()))
+
+
+def mann_whitney_slower(baseline, candidate):
+    """One-sided Mann-Whitney U (normal approximation, tie-corrected):
+    p-value for 'candidate times are larger than baseline times'"""
+    n1, n2 = len(baseline), len(candidate)
+    ranked = sorted([(v, 0) for v in baseline] + [(v, 1) for v in candidate])
+    ranks = [0.0] * len(ranked)
+    ties = 0.0
+    i = 0
+    while i < len(ranked):
+        j = i
+        while j + 1 < len(ranked) and ranked[j + 1][0] == ranked[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        ties += (j - i + 1) ** 3 - (j - i + 1)
+        i = j + 1
+
+    rank_sum = sum(r for r, (_, group) in zip(ranks, ranked) if group == 1)
+    u = rank_sum - n2 * (n2 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def resolve_commit(commits, ref):
+    """Exact match on a recorded id, otherwise a prefix that names exactly one recorded id
+    (so 'abc123' is ambiguous when both 'abc123...' and 'abc123...-dirty' were recorded)"""
+    if ref in commits:
+        return ref
+    matches = [commit for commit in commits if commit.startswith(ref)]
+    if not matches:
+        raise ValueError(f"No recorded run for commit '{ref}'")
+    if len(matches) > 1:
+        raise ValueError(f"Commit '{ref}' is ambiguous: {', '.join(matches)}")
+    return matches[0]
+
+
+def compare(baseline=None, candidate=None, workload='experiment', alpha=0.05, min_slowdown=0.05, db_path=DB_PATH):
+    """Compares time samples of two commits on this machine, per algorithm and maze size.
+    Defaults to the two most recent commits in the history. Returns the flagged regressions."""
+    history = load_history(workload, db_path=db_path)
+    #////////// ordered by each commit's latest run, so re-recording an old commit makes it current again
+    commits = list(history.groupby('Commit_Id')['Run'].max().sort_values().index)
+    if candidate is None:
+        candidate = commits[-1] if commits else None
+    if baseline is None:
+        earlier = [c for c in commits if c != candidate]
+        baseline = earlier[-1] if earlier else None
+    if baseline is None or candidate is None:
+        print("[!] Need runs from two different commits on this machine to compare.")
+        return []
+
+    baseline = resolve_commit(commits, baseline)
+    candidate = resolve_commit(commits, candidate)
+    if baseline == candidate:
+        raise ValueError(f"Baseline and candidate are the same commit '{baseline}'")
+
+    old = history[history['Commit_Id'] == baseline]
+    new = history[history['Commit_Id'] == candidate]
+    print(f"Baseline {baseline[:12]} ({len(old)} samples) vs candidate {candidate[:12]} ({len(new)} samples)")
+
+    regressions = []
+    for (algo, size), new_group in new.groupby(['Algorithm', 'Maze_Size']):
+        old_group = old[(old['Algorithm'] == algo) & (old['Maze_Size'] == size)]
+        #////////// each sample is scaled by its (complexity, distance) case's baseline median,
+        # so the different cases inside one size can be pooled into a single test
+        cell_medians = old_group.groupby(['Complexity', 'Distance_Case'])['Time_Seconds'].median()
+        cell_medians = cell_medians[cell_medians > 0]
+        old_scaled, new_scaled = [], []
+        for scaled, group in ((old_scaled, old_group), (new_scaled, new_group)):
+            for (complexity, case), seconds in zip(zip(group['Complexity'], group['Distance_Case']), group['Time_Seconds']):
+                if (complexity, case) in cell_medians.index:
+                    scaled.append(seconds / cell_medians[(complexity, case)])
+        if len(old_scaled) < 3 or len(new_scaled) < 3:
+            continue
+        old_median = statistics.median(old_group['Time_Seconds'])
+        new_median = statistics.median(new_group['Time_Seconds'])
+        ratio = statistics.median(new_scaled) / statistics.median(old_scaled)
+        p = mann_whitney_slower(old_scaled, new_scaled)
+        flagged = p < alpha and ratio > 1 + min_slowdown
+        marker = "SLOWER" if flagged else "ok"
+        print(f"  {algo:<8} {size:>3}x{size:<3} median {old_median:.6f}s -> {new_median:.6f}s "
+              f"({ratio:.2f}x, p={p:.4f}) {marker}")
+        if flagged:
+            regressions.append({'Algorithm': algo, 'Maze_Size': size, 'Ratio': ratio, 'P_Value': p})
+
+    print(f"[{'!' if regressions else 'OK'}] {len(regressions)} significant slowdown(s)")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark history and regression detection")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    rec = sub.add_parser('record', help="append an experiment_results.csv file to the history")
+    rec.add_argument('csv_path', nargs='?', default='experiment_results.csv')
+    rec.add_argument('--workload', default='experiment')
+
+    cmp_ = sub.add_parser('compare', help="flag significant slowdowns between two commits")
+    cmp_.add_argument('--baseline')
+    cmp_.add_argument('--candidate')
+    cmp_.add_argument('--workload', default='experiment')
+    cmp_.add_argument('--alpha', type=float, default=0.05)
+
+    trend = sub.add_parser('trend', help="chart time per algorithm and size across recorded runs")
+    trend.add_argument('--workload', default='experiment')
+
+    args = parser.parse_args()
+    if args.command == 'record':
+        with open(args.csv_path, newline='') as file:
+            rows = list(csv.reader(file))[1:]
+        run_id = record_run(rows, workload=args.workload)
+        print(f"[OK] Recorded run {run_id} ({len(rows)} samples) for commit {git_commit()[:12]}")
+    elif args.command == 'compare':
+        try:
+            regressions = compare(args.baseline, args.candidate, workload=args.workload, alpha=args.alpha)
+        except ValueError as error:
+            print(f"[!] {error}")
+            raise SystemExit(2)
+        raise SystemExit(1 if regressions else 0)
+    else:
+        from plot_results import plot_history
+        plot_history(workload=args.workload)
+
+
+if __name__ == "__main__":
+    main()
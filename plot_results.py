@@ -3,6 +3,7 @@ import pandas as pd
 import os
 import numpy as np
 from datetime import datetime
+from perf_history import load_history
 
 
 def filter_by_condition(maze_size, complexity, distance_case):
@@ -14,7 +15,7 @@ def filter_by_condition(maze_size, complexity, distance_case):
         )
     return condition
 
-def plot_results(filter_condition=None, dataset_source='csv', current_data=None, chart_type='auto'):
+def plot_results(filter_condition=None, dataset_source='csv', current_data=None, chart_type='auto', cell_stats=None):
     if dataset_source == 'csv':
         try:
             df = pd.read_csv('experiment_results.csv')
@@ -106,9 +107,9 @@ def plot_results(filter_condition=None, dataset_source='csv', current_data=None,
         plt.tight_layout()
         plt.show()
 
-    generate_interpretation(filtered_df, dataset_source)
+    generate_interpretation(filtered_df, dataset_source, cell_stats)
 
-def generate_interpretation(df, data_source):
+def generate_interpretation(df, data_source, cell_stats=None):
     timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     report_lines = [
         f"==============================",
@@ -177,6 +178,41 @@ def generate_interpretation(df, data_source):
         report_lines.append("Most space-efficient: DFS")
 
     report_lines.append("\n Trade-offs observed: consider maze size, available memory, and required path quality.\n")
+
+    #///////////////Adaptive sampling: how much evidence sits behind each case
+    if cell_stats:
+        stats_df = pd.DataFrame(cell_stats)
+        report_lines.append("==============================\n")
+        report_lines.append("Sampling Confidence (95% CI):")
+        for algo in ['BFS', 'DFS', 'A*']:
+            algo_stats = stats_df[stats_df['Algorithm'] == algo]
+            if algo_stats.empty:
+                continue
+            time_rel = (algo_stats['Time_Seconds_CI'] / algo_stats['Time_Seconds_Mean']).median()
+            space_rel = (algo_stats['Visited_Nodes_CI'] / algo_stats['Visited_Nodes_Mean'].where(algo_stats['Visited_Nodes_Mean'] > 0)).median()
+            report_lines.append(f"- {algo}: {int(algo_stats['Samples'].sum())} samples, "
+                                f"median CI ±{time_rel:.1%} time, ±{space_rel:.1%} visited")
+
+        cases = stats_df.groupby(['Maze_Size', 'Complexity', 'Distance_Case'])
+        converged = int(cases['Converged'].first().sum())
+        report_lines.append(f"Cases meeting the confidence target: {converged}/{len(cases)}")
+
+        #///////////////A case's fastest algorithm only counts if its interval clears the runner-up's
+        clear_wins = 0
+        for _, case in cases:
+            ranked = case.sort_values('Time_Seconds_Mean')
+            if len(ranked) > 1:
+                best, second = ranked.iloc[0], ranked.iloc[1]
+                if best['Time_Seconds_Mean'] + best['Time_Seconds_CI'] < second['Time_Seconds_Mean'] - second['Time_Seconds_CI']:
+                    clear_wins += 1
+        report_lines.append(f"Cases with a statistically clear fastest algorithm: {clear_wins}/{len(cases)}")
+
+        unsettled = cases.filter(lambda case: not case['Converged'].iloc[0])
+        for (size, complexity, distance_case), case in unsettled.groupby(['Maze_Size', 'Complexity', 'Distance_Case']):
+            report_lines.append(f"- Not converged: {size}x{size}, complexity {complexity}, {distance_case} "
+                                f"({int(case['Samples'].iloc[0])} samples)")
+        report_lines.append("")
+
     report_lines.append("==============================")
 
     with open('experiment_interpretation.txt', 'w', encoding='utf-8') as f:
@@ -185,6 +221,73 @@ def generate_interpretation(df, data_source):
     print("Report generated and saved in experiment_interpretation.txt")
 
 
+# ///////////////Trend of median solve time per maze size across recorded runs (see perf_history.py)
+def plot_history(workload='experiment', metric='Time_Seconds'):
+    history = load_history(workload)
+    if history.empty:
+        print("[!] No benchmark history recorded for this machine yet.")
+        return
+
+    runs = history.drop_duplicates('Run')[['Run', 'Commit_Id', 'Recorded_At']]
+    labels = [f"{commit[:7]}\n{recorded[:10]}" for commit, recorded in zip(runs['Commit_Id'], runs['Recorded_At'])]
+    positions = {run: i for i, run in enumerate(runs['Run'])}
+
+    algorithms = [algo for algo in ['BFS', 'DFS', 'A*'] if algo in set(history['Algorithm'])]
+    fig, axs = plt.subplots(1, len(algorithms), figsize=(6 * len(algorithms), 5), squeeze=False)
+    fig.suptitle(f"{metric} history ({workload})", fontsize=14)
+
+    for ax, algo in zip(axs[0], algorithms):
+        subset = history[history['Algorithm'] == algo]
+        medians = subset.groupby(['Maze_Size', 'Run'])[metric].median().reset_index()
+        for size, group in medians.groupby('Maze_Size'):
+            ax.plot([positions[run] for run in group['Run']], group[metric], marker='o', label=f"{size}x{size}")
+        ax.set_title(algo)
+        ax.set_xticks(range(len(labels)))
+        ax.set_xticklabels(labels, rotation=45, ha='right', fontsize=8)
+        ax.set_ylabel(f"Median {metric}")
+        ax.grid(True, linestyle='--', alpha=0.6)
+        ax.legend(title="Maze Size")
+
+    plt.tight_layout()
+    os.makedirs('plots', exist_ok=True)
+    image_path = f"plots/history_{workload}_{datetime.now().strftime('%Y%m%d_%H%M')}.png"
+    plt.savefig(image_path)
+    plt.show()
+    print(f"[✔] History plot saved to {image_path}")
+    return image_path
+
+
+# ///////////////Anytime search: path quality (optimal / found length) against the per-query time budget
+def plot_anytime_quality(records):
+    df = pd.DataFrame(records, columns=["Budget_ms", "Maze_Size", "Complexity", "Path_Length", "Optimal_Length", "Bound"])
+    df['Quality'] = np.where(df['Path_Length'] > 0, df['Optimal_Length'] / df['Path_Length'].where(df['Path_Length'] > 0), 0.0)
+    df['Bound_Quality'] = np.where(np.isfinite(df['Bound']), 1 / df['Bound'], 0.0)
+
+    fig, axs = plt.subplots(1, 2, figsize=(14, 6))
+    fig.suptitle("ARA*: Path Quality vs Time Budget", fontsize=14)
+    for size, group in df.groupby('Maze_Size'):
+        means = group.groupby('Budget_ms')[['Quality', 'Bound_Quality']].mean()
+        axs[0].plot(means.index, means['Quality'], marker='o', label=f"{size}x{size}")
+        axs[1].plot(means.index, means['Bound_Quality'], marker='s', linestyle='--', label=f"{size}x{size}")
+
+    axs[0].set_ylabel("Optimal / Found Path Length (0 = no path yet)")
+    axs[1].set_ylabel("Guaranteed Quality (1 / suboptimality bound)")
+    for ax in axs:
+        ax.set_xscale('log')
+        ax.set_xlabel("Time Budget (ms)")
+        ax.set_ylim(0, 1.05)
+        ax.grid(True, linestyle='--', alpha=0.6)
+        ax.legend(title="Maze Size")
+
+    plt.tight_layout()
+    os.makedirs('plots', exist_ok=True)
+    image_path = f"plots/anytime_quality_{datetime.now().strftime('%Y%m%d_%H%M')}.png"
+    plt.savefig(image_path)
+    plt.show()
+    print(f"[✔] Anytime quality plot saved to {image_path}")
+    return image_path
+
+
 def plot_maze_results(bfs_time, dfs_time, astar_time,
                      bfs_space, dfs_space, astar_space,
                      bfs_path_len, dfs_path_len, astar_path_len,
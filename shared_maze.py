@@ -0,0 +1,95 @@
+#///// shared_maze.py: publish a maze grid into shared memory once and let worker processes
+# attach to it zero-copy as a read-only NumPy view that bfs/dfs/a_star accept directly.
+
+import sys
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+from pathfinding import bfs, dfs, a_star
+
+ALGORITHMS = {'bfs': bfs, 'dfs': dfs, 'a_star': a_star}
+
+#///////////// segments this process has attached to, kept alive for the life of the process
+_attached = {}
+_worker_grid = None
+
+
+def _release(shm):
+    try:
+        shm.close()
+    except BufferError:
+        #////////// a view is still alive; the mapping goes away with the process
+        pass
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+
+class SharedGrid:
+    """Owner side: copies the grid into a shared memory segment once. The segment is
+    unlinked on unlink(), on leaving a with block, or when the object is collected
+    or the interpreter exits, whichever comes first."""
+
+    def __init__(self, grid):
+        source = np.asarray(grid, dtype=np.uint8)
+        self.shape = source.shape
+        self._shm = shared_memory.SharedMemory(create=True, size=max(source.nbytes, 1))
+        self.array = np.ndarray(self.shape, dtype=np.uint8, buffer=self._shm.buf)
+        self.array[:] = source
+        self._finalizer = weakref.finalize(self, _release, self._shm)
+
+    @property
+    def name(self):
+        return self._shm.name
+
+    def descriptor(self):
+        """Small picklable handle to send to workers instead of the grid itself"""
+        return self.name, self.shape
+
+    def unlink(self):
+        self.array = None
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.unlink()
+
+
+def attach_grid(descriptor):
+    """Worker side: read-only (rows, cols) uint8 view onto a published grid, no copy"""
+    name, shape = descriptor
+    shm = _attached.get(name)
+    if shm is None:
+        #////////// only the owner should unlink, so attaching processes do not track the segment
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            shm = shared_memory.SharedMemory(name=name)
+        _attached[name] = shm
+    view = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+    view.flags.writeable = False
+    return view
+
+
+def _init_worker(descriptor):
+    global _worker_grid
+    _worker_grid = attach_grid(descriptor)
+
+
+def _solve(query):
+    algorithm, start, end = query
+    return ALGORITHMS[algorithm](_worker_grid, start, end)
+
+
+def solve_parallel(grid, queries, algorithm='bfs', processes=None):
+    """Solves (start, end) queries across worker processes that share one copy of the grid.
+    Returns a list of (path, visited) in query order. The segment is unlinked even if a
+    worker dies (the pool then raises BrokenProcessPool)."""
+    with SharedGrid(grid) as shared:
+        with ProcessPoolExecutor(max_workers=processes, initializer=_init_worker,
+                                 initargs=(shared.descriptor(),)) as pool:
+            return list(pool.map(_solve, [(algorithm, start, end) for start, end in queries]))
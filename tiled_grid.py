@@ -0,0 +1,198 @@
+#///// tiled_grid.py: out-of-core maze grids. Cells live in fixed-size tiles inside a
+# memory-mapped file and only an LRU of hot tiles is kept in RAM.
+
+import json
+import random
+from collections import OrderedDict
+import numpy as np
+
+
+class _Row:
+    """Row view so grid[r][c] and len(grid[0]) work exactly like the list-of-lists grid"""
+
+    def __init__(self, grid, r):
+        self._grid = grid
+        self._r = r
+
+    def __getitem__(self, c):
+        return self._grid.get(self._r, c)
+
+    def __setitem__(self, c, value):
+        self._grid.set(self._r, c, value)
+
+    def __len__(self):
+        return self._grid.cols
+
+
+class TiledGrid:
+
+    def __init__(self, path, mode='r+', cache_tiles=64):
+        with open(path + '.json') as f:
+            meta = json.load(f)
+        self.path = path
+        self.rows = meta['rows']
+        self.cols = meta['cols']
+        self.tile_size = meta['tile_size']
+        self.cache_tiles = cache_tiles
+        #///////////// on-disk layout (tile_rows, tile_cols, tile, tile) keeps every tile contiguous
+        self._store = np.lib.format.open_memmap(path, mode=mode)
+        self._cache = OrderedDict()
+        self._dirty = set()
+        self.faults = 0
+        self.hits = 0
+        self.writebacks = 0
+
+    @classmethod
+    def create(cls, path, rows, cols, tile_size=256, cache_tiles=64):
+        """Allocates an all-wall grid on disk (0 = wall, like Maze.grid)"""
+        shape = (-(-rows // tile_size), -(-cols // tile_size), tile_size, tile_size)
+        store = np.lib.format.open_memmap(path, mode='w+', dtype=np.uint8, shape=shape)
+        del store
+        with open(path + '.json', 'w') as f:
+            json.dump({'rows': rows, 'cols': cols, 'tile_size': tile_size}, f)
+        return cls(path, cache_tiles=cache_tiles)
+
+    def _tile(self, tr, tc):
+        key = (tr, tc)
+        tile = self._cache.get(key)
+        if tile is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return tile
+
+        self.faults += 1
+        tile = np.array(self._store[tr, tc])
+        self._cache[key] = tile
+        if len(self._cache) > self.cache_tiles:
+            old_key, old_tile = self._cache.popitem(last=False)
+            if old_key in self._dirty:
+                self._store[old_key] = old_tile
+                self._dirty.discard(old_key)
+                self.writebacks += 1
+        return tile
+
+    def get(self, r, c):
+        t = self.tile_size
+        return int(self._tile(r // t, c // t)[r % t, c % t])
+
+    def set(self, r, c, value):
+        t = self.tile_size
+        self._tile(r // t, c // t)[r % t, c % t] = value
+        self._dirty.add((r // t, c // t))
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, r):
+        return _Row(self, r)
+
+    def flush(self):
+        for key in self._dirty:
+            self._store[key] = self._cache[key]
+            self.writebacks += 1
+        self._dirty.clear()
+        self._store.flush()
+
+    def close(self):
+        """Writes back dirty tiles and releases the mapping"""
+        if self._store is None:
+            return
+        self.flush()
+        self._cache.clear()
+        self._store = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def stats(self):
+        return {'faults': self.faults, 'hits': self.hits, 'writebacks': self.writebacks,
+                'resident_tiles': len(self._cache)}
+
+    def reset_stats(self):
+        self.faults = self.hits = self.writebacks = 0
+
+    def to_list(self):
+        """Materializes the whole grid; only for grids that fit in memory"""
+        self.flush()
+        t = self.tile_size
+        full = self._store.transpose(0, 2, 1, 3).reshape(self._store.shape[0] * t, self._store.shape[1] * t)
+        return full[:self.rows, :self.cols].tolist()
+
+
+def _carve_tile(tile, r0, c0, rows, cols, rng):
+    """Iterative recursive-backtracker over the odd cells of one tile"""
+    t = tile.shape[0]
+    r_end = min(t, rows - 1 - r0)
+    c_end = min(t, cols - 1 - c0)
+    if r_end <= 1 or c_end <= 1:
+        return
+    tile[1, 1] = 1
+    stack = [(1, 1)]
+    directions = [(0, 2), (2, 0), (0, -2), (-2, 0)]
+
+    while stack:
+        r, c = stack[-1]
+        options = [(dr, dc) for dr, dc in directions
+                   if 1 <= r + dr < r_end and 1 <= c + dc < c_end and tile[r + dr, c + dc] == 0]
+        if not options:
+            stack.pop()
+            continue
+        dr, dc = rng.choice(options)
+        tile[r + dr // 2, c + dc // 2] = 1
+        tile[r + dr, c + dc] = 1
+        stack.append((r + dr, c + dc))
+
+
+def generate_tiled_maze(path, rows, cols, complexity=0.3, tile_size=256, cache_tiles=64, seed=None):
+    """Streams a maze to disk one tile at a time, so memory stays O(tile_size^2).
+    Each tile is carved on its own and then joined to the tiles on its left and above.
+    Returns (grid, start, end) like Maze.generate, with grid a TiledGrid."""
+    if tile_size % 2:
+        raise ValueError("tile_size must be even so maze cells stay on odd coordinates")
+    rng = random.Random(seed)
+    grid = TiledGrid.create(path, rows, cols, tile_size=tile_size, cache_tiles=cache_tiles)
+    store = grid._store
+
+    for tr in range(store.shape[0]):
+        for tc in range(store.shape[1]):
+            r0, c0 = tr * tile_size, tc * tile_size
+            tile = np.zeros((tile_size, tile_size), dtype=np.uint8)
+            _carve_tile(tile, r0, c0, rows, cols, rng)
+
+            #//////////// one opening into the tile on the left and the tile above, only from tiles
+            # that carved cells, so joints never land on the outer border
+            r_end = min(tile_size, rows - 1 - r0)
+            c_end = min(tile_size, cols - 1 - c0)
+            if r_end > 1 and c_end > 1:
+                if tc > 0:
+                    tile[rng.choice(range(1, r_end, 2)), 0] = 1
+                if tr > 0:
+                    tile[0, rng.choice(range(1, c_end, 2))] = 1
+
+            #//////////// extra paths and braiding, same densities as Maze.generate
+            r_lo, r_hi = max(1, r0) - r0, min(rows - 2, r0 + tile_size - 1) - r0
+            c_lo, c_hi = max(1, c0) - c0, min(cols - 2, c0 + tile_size - 1) - c0
+            if r_lo <= r_hi and c_lo <= c_hi:
+                extra = int((complexity + 0.05) * tile_size * tile_size)
+                tile[[rng.randint(r_lo, r_hi) for _ in range(extra)],
+                     [rng.randint(c_lo, c_hi) for _ in range(extra)]] = 1
+
+            store[tr, tc] = tile
+
+    store.flush()
+
+    def random_cell():
+        return (rng.randrange(1, rows - 1, 2), rng.randrange(1, cols - 1, 2))
+
+    start = random_cell()
+    end = random_cell()
+    while end == start:
+        end = random_cell()
+    grid.set(start[0], start[1], 2)
+    grid.set(end[0], end[1], 3)
+    grid.flush()
+    grid.reset_stats()
+    return grid, start, end